@@ -6,8 +6,21 @@ The Claude Agent SDK acts as the reasoning and execution layer, while Letta
 provides persistent memory through in-process MCP tools.
 """
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.2.0"
 
-from nameless.core import NamelessAgent, create_letta_mcp_server, run_agent
+if TYPE_CHECKING:
+    from nameless.core import NamelessAgent, create_letta_mcp_server, run_agent
 
 __all__ = ["NamelessAgent", "create_letta_mcp_server", "run_agent"]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved on first access so that importing a submodule (e.g. a CLI script)
+    # doesn't load the Claude Agent SDK and Letta client.
+    if name in __all__:
+        from nameless import core
+
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,76 +3,84 @@
 Loads settings from environment variables with sensible defaults for local development.
 """
 
-from functools import lru_cache
+from functools import cache
 
-from pydantic import Field
+from pydantic import BaseModel, ConfigDict, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
-class LettaConfig(BaseSettings):
-    """Letta server connection settings."""
+class LettaConfig(BaseModel):
+    """Letta server connection settings (``LETTA_*``)."""
 
-    model_config = SettingsConfigDict(env_prefix="LETTA_", env_file=".env", extra="ignore")
+    model_config = ConfigDict(defer_build=True)
 
     base_url: str = Field(default="http://localhost:8283", description="Letta server URL")
     api_key: str | None = Field(default=None, description="Letta API key for authentication")
 
 
-class AgentConfig(BaseSettings):
-    """Nameless agent-specific settings."""
+class AgentConfig(BaseModel):
+    """Nameless agent-specific settings (``NAMELESS_*``)."""
 
-    model_config = SettingsConfigDict(env_prefix="NAMELESS_", env_file=".env", extra="ignore")
+    model_config = ConfigDict(defer_build=True)
 
     agent_id: str | None = Field(default=None, description="Letta agent ID (set after import)")
 
 
-class BlueskyConfig(BaseSettings):
-    """Bluesky/AT Protocol settings."""
+class BlueskyConfig(BaseModel):
+    """Bluesky/AT Protocol settings (``BLUESKY_*``)."""
 
-    model_config = SettingsConfigDict(env_prefix="BLUESKY_", env_file=".env", extra="ignore")
+    model_config = ConfigDict(defer_build=True)
 
     handle: str | None = Field(default=None, description="Bluesky handle (e.g., user.bsky.social)")
     app_password: str | None = Field(default=None, description="Bluesky app password")
 
 
-class DiscordConfig(BaseSettings):
-    """Discord bot settings."""
+class DiscordConfig(BaseModel):
+    """Discord bot settings (``DISCORD_*``)."""
 
-    model_config = SettingsConfigDict(env_prefix="DISCORD_", env_file=".env", extra="ignore")
+    model_config = ConfigDict(defer_build=True)
 
     bot_token: str | None = Field(default=None, description="Discord bot token")
     guild_id: str | None = Field(default=None, description="Primary Discord guild/server ID")
 
 
-class TriggerConfig(BaseSettings):
-    """Trigger/scheduler settings."""
+class TriggerConfig(BaseModel):
+    """Trigger/scheduler settings (``PERCH_*``)."""
 
-    model_config = SettingsConfigDict(env_prefix="", env_file=".env", extra="ignore")
+    model_config = ConfigDict(defer_build=True)
 
-    perch_interval_hours: int = Field(default=2, description="Hours between perch time wakeups")
+    perch_interval_hours: int = Field(default=2, alias="interval_hours", description="Hours between perch time wakeups")
 
 
 class Settings(BaseSettings):
-    """Aggregated settings for Nameless agent."""
+    """Aggregated settings for Nameless agent.
+
+    This is the only ``BaseSettings`` class, so ``.env`` and the process
+    environment are read once. Each section is populated from variables named
+    ``<PREFIX>_<FIELD>`` (e.g. ``LETTA_BASE_URL`` -> ``letta.base_url``).
+    """
 
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
+        env_nested_delimiter="_",
+        env_nested_max_split=1,
         extra="ignore",
+        defer_build=True,
     )
 
     letta: LettaConfig = Field(default_factory=LettaConfig)
-    agent: AgentConfig = Field(default_factory=AgentConfig)
+    agent: AgentConfig = Field(default_factory=AgentConfig, alias="nameless")
     bluesky: BlueskyConfig = Field(default_factory=BlueskyConfig)
     discord: DiscordConfig = Field(default_factory=DiscordConfig)
-    triggers: TriggerConfig = Field(default_factory=TriggerConfig)
+    triggers: TriggerConfig = Field(default_factory=TriggerConfig, alias="perch")
 
     # API Keys
     anthropic_api_key: str | None = Field(default=None, alias="ANTHROPIC_API_KEY")
     openai_api_key: str | None = Field(default=None, alias="OPENAI_API_KEY")
 
 
-@lru_cache
+@cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
@@ -5,8 +5,9 @@ reasoning engine with Letta providing persistent memory via MCP tools.
 """
 
 import logging
+import time
 from collections.abc import AsyncIterator
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any
 
 from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient  # type: ignore[import-not-found]
@@ -35,8 +36,21 @@ Core values:
 
 Be thoughtful, comfortable with ambiguity, occasionally playful. Never performatively human or artificially robotic."""
 
+# How long a persona loaded from Letta is reused before fetching it again
+PERSONA_CACHE_TTL_SECONDS = 300.0
 
-@dataclass
+# Letta MCP tools the agent may call without prompting
+LETTA_ALLOWED_TOOLS = (
+    "mcp__letta__get_memory_block",
+    "mcp__letta__update_memory_block",
+    "mcp__letta__search_archival_memory",
+    "mcp__letta__insert_archival_memory",
+    "mcp__letta__list_memory_blocks",
+    "mcp__letta__get_recent_messages",
+)
+
+
+@dataclass(slots=True)
 class NamelessAgent:
     """The Nameless agent powered by Claude with Letta memory.
 
@@ -47,51 +61,61 @@ class NamelessAgent:
     agent_id: str | None = None
     system_prompt: str | None = None
     _client: AsyncLetta | None = field(default=None, repr=False)
+    _options_template: ClaudeAgentOptions | None = field(default=None, init=False, repr=False)
+    _persona_cache: tuple[float, str] | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
-        settings = get_settings()
-
         if self._client is None:
-            self._client = AsyncLetta(base_url=settings.letta.base_url)
+            self._client = AsyncLetta(base_url=get_settings().letta.base_url)
 
         if self.agent_id is None:
-            self.agent_id = settings.agent.agent_id
+            self.agent_id = get_settings().agent.agent_id
 
     async def load_persona_from_letta(self) -> str:
-        """Load the persona block from Letta to use as system prompt."""
+        """Load the persona block from Letta to use as system prompt.
+
+        A persona loaded successfully is reused for PERSONA_CACHE_TTL_SECONDS
+        so consecutive runs don't each pay a round-trip to Letta.
+        """
         if not self.agent_id or not self._client:
             logger.warning("No agent_id or client configured, using default system prompt")
             return DEFAULT_SYSTEM_PROMPT
 
+        now = time.monotonic()
+        if self._persona_cache is not None:
+            loaded_at, persona = self._persona_cache
+            if now - loaded_at < PERSONA_CACHE_TTL_SECONDS:
+                return persona
+
         try:
             block = await self._client.agents.blocks.retrieve("persona", agent_id=self.agent_id)
             if block and block.value:
                 logger.info("Loaded persona from Letta")
+                self._persona_cache = (now, block.value)
                 return block.value
         except Exception as e:
-            logger.warning(f"Failed to load persona from Letta: {e}")
+            logger.warning("Failed to load persona from Letta: %s", e)
 
         return DEFAULT_SYSTEM_PROMPT
 
     def _build_options(self, system_prompt: str) -> ClaudeAgentOptions:
-        """Build Claude agent options with Letta MCP server."""
-        mcp_server = create_letta_mcp_server(
-            letta_client=self._client,
-            agent_id=self.agent_id,
-        )
-
-        return ClaudeAgentOptions(
-            system_prompt=system_prompt,
-            mcp_servers={"letta": mcp_server},
-            allowed_tools=[
-                "mcp__letta__get_memory_block",
-                "mcp__letta__update_memory_block",
-                "mcp__letta__search_archival_memory",
-                "mcp__letta__insert_archival_memory",
-                "mcp__letta__list_memory_blocks",
-                "mcp__letta__get_recent_messages",
-            ],
-        )
+        """Build Claude agent options with Letta MCP server.
+
+        The MCP server and the rest of the options never change for a given
+        agent, so they are assembled once and only the system prompt is
+        substituted per run.
+        """
+        if self._options_template is None:
+            mcp_server = create_letta_mcp_server(
+                letta_client=self._client,
+                agent_id=self.agent_id,
+            )
+            self._options_template = ClaudeAgentOptions(
+                mcp_servers={"letta": mcp_server},
+                allowed_tools=list(LETTA_ALLOWED_TOOLS),
+            )
+
+        return replace(self._options_template, system_prompt=system_prompt)
 
     async def run(self, message: str) -> AsyncIterator[dict[str, Any]]:
         """Run the agent with a message and stream responses.
@@ -128,6 +152,11 @@ class NamelessAgent:
             responses.append(msg)
         return responses
 
+    async def close(self) -> None:
+        """Close the Letta client and its pooled connections."""
+        if self._client is not None:
+            await self._client.close()
+
 
 async def run_agent(
     message: str,
@@ -10,9 +10,42 @@ from typing import Any
 
 from claude_agent_sdk import create_sdk_mcp_server, tool  # type: ignore[import-not-found]
 from letta_client import AsyncLetta
+from pydantic_core import to_json
 
 from nameless.config import get_settings
 
+# Message class -> (has content field, has date field), or None if not a model
+_message_layouts: dict[type, tuple[bool, bool] | None] = {}
+
+
+def _message_layout(message_type: type) -> tuple[bool, bool] | None:
+    """Return whether a message class declares ``content`` and ``date`` fields.
+
+    Letta message types are pydantic models, so this is worked out once per
+    class. Returns None for other types, which are probed per instance.
+    """
+    if message_type not in _message_layouts:
+        fields = getattr(message_type, "model_fields", None)
+        _message_layouts[message_type] = ("content" in fields, "date" in fields) if isinstance(fields, dict) else None
+    return _message_layouts[message_type]
+
+
+def _format_message(m: Any) -> dict[str, Any]:
+    """Summarize a Letta message for the get_recent_messages tool."""
+    layout = _message_layout(type(m))
+    has_content, has_date = layout if layout is not None else (hasattr(m, "content"), hasattr(m, "date"))
+    entry = {"type": type(m).__name__}
+    if has_content:
+        content = m.content
+        if isinstance(content, str):
+            entry["content"] = content[:500]
+        else:
+            # Structured content (e.g. a list of content parts) is rendered as JSON
+            entry["content"] = to_json(content, serialize_unknown=True)[:500].decode(errors="ignore")
+    if has_date:
+        entry["date"] = str(m.date)
+    return entry
+
 
 def create_letta_mcp_server(letta_client: AsyncLetta | None = None, agent_id: str | None = None) -> Any:
     """Create an MCP server with Letta memory tools.
@@ -25,13 +58,11 @@ def create_letta_mcp_server(letta_client: AsyncLetta | None = None, agent_id: st
     Returns:
         An MCP server instance with Letta tools registered.
     """
-    settings = get_settings()
-
     if letta_client is None:
-        letta_client = AsyncLetta(base_url=settings.letta.base_url)
+        letta_client = AsyncLetta(base_url=get_settings().letta.base_url)
 
     if agent_id is None:
-        agent_id = settings.agent.agent_id
+        agent_id = get_settings().agent.agent_id
         if agent_id is None:
             raise ValueError("No agent_id provided and NAMELESS_AGENT_ID not set")
 
@@ -61,7 +92,7 @@ def create_letta_mcp_server(letta_client: AsyncLetta | None = None, agent_id: st
         count = args.get("count", 10)
         results = await _letta.agents.passages.search(_agent_id, query=query, top_k=count)
         entries = [{"text": r.passage.text, "score": r.score} for r in results]
-        return {"content": [{"type": "text", "text": str(entries)}]}
+        return {"content": [{"type": "text", "text": to_json(entries).decode()}]}
 
     @tool("insert_archival_memory", "Store a new entry in archival memory.", {"text": str})
     async def insert_archival_memory(args: dict[str, Any]) -> dict[str, Any]:
@@ -75,22 +106,15 @@ def create_letta_mcp_server(letta_client: AsyncLetta | None = None, agent_id: st
         """List all core memory blocks."""
         blocks_list = await _letta.agents.blocks.list(_agent_id)
         blocks = [{"label": b.label, "value_length": len(b.value) if b.value else 0} for b in blocks_list]
-        return {"content": [{"type": "text", "text": str(blocks)}]}
+        return {"content": [{"type": "text", "text": to_json(blocks).decode()}]}
 
     @tool("get_recent_messages", "Get recent conversation messages.", {"count": int})
     async def get_recent_messages(args: dict[str, Any]) -> dict[str, Any]:
         """Get recent messages from recall memory."""
         count = args.get("count", 10)
         messages = await _letta.agents.messages.list(_agent_id, limit=count)
-        formatted = []
-        for m in messages:
-            entry = {"type": type(m).__name__}
-            if hasattr(m, "content"):
-                entry["content"] = str(m.content)[:500]
-            if hasattr(m, "date"):
-                entry["date"] = str(m.date)
-            formatted.append(entry)
-        return {"content": [{"type": "text", "text": str(formatted)}]}
+        formatted = [_format_message(m) for m in messages]
+        return {"content": [{"type": "text", "text": to_json(formatted).decode()}]}
 
     # Create the MCP server with all tools
     return create_sdk_mcp_server(
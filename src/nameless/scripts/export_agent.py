@@ -15,22 +15,29 @@ Usage:
     nameless-export <agent_id> --source-url https://api.letta.com --api-key <key>
 """
 
+from __future__ import annotations
+
 import argparse
-import json
 import logging
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from letta_client import Letta
+from pydantic_core import from_json, to_json
 
 from nameless.config import get_settings
 
+if TYPE_CHECKING:
+    from letta_client import Letta
+    from letta_client.types import Passage
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportResult:
     """Result of an agent export operation."""
 
@@ -51,64 +58,100 @@ def create_letta_client(base_url: str, api_key: str | None = None) -> Letta:
     Returns:
         Configured Letta client
     """
+    from letta_client import Letta
+
     kwargs: dict = {"base_url": base_url}
     if api_key:
         kwargs["api_key"] = api_key
     return Letta(**kwargs)
 
 
-def export_passages(client: Letta, agent_id: str, output_path: Path) -> int:
+def export_passages(client: Letta, agent_id: str, output_path: Path, pretty: bool = False) -> int:
     """Export all archival memory passages for an agent.
 
     Args:
         client: Letta client
         agent_id: The agent ID
         output_path: Where to save the passages JSON
+        pretty: Indent the JSON output for readability (default: compact)
 
     Returns:
         Number of passages exported
     """
-    logger.info(f"Exporting archival memory passages for agent {agent_id}")
+    logger.info("Exporting archival memory passages for agent %s", agent_id)
 
-    all_passages = []
-    after_cursor = None
+    count = 0
     limit = 100
 
-    # Paginate through all passages
-    while True:
-        kwargs: dict = {"limit": limit}
+    def fetch_page(after_cursor: str | None) -> list[Passage]:
+        kwargs: dict[str, Any] = {"limit": limit}
         if after_cursor:
             kwargs["after"] = after_cursor
-
-        passages_list = client.agents.passages.list(agent_id, **kwargs)
-
         # API returns a list directly
-        if not passages_list:
-            break
-
-        for p in passages_list:
-            passage_data = {
-                "id": p.id,
-                "text": p.text,
-                "created_at": p.created_at.isoformat() if p.created_at else None,
-                "metadata": p.metadata,
-                "tags": p.tags,
-            }
-            all_passages.append(passage_data)
-
-        # If we got fewer than limit, we're done
-        if len(passages_list) < limit:
-            break
-
-        # Use last passage ID as cursor for next page
-        after_cursor = passages_list[-1].id
-
-    # Write passages to file
-    with open(output_path, "w") as f:
-        json.dump({"agent_id": agent_id, "passages": all_passages}, f, indent=2)
-
-    logger.info(f"Exported {len(all_passages)} passages to {output_path}")
-    return len(all_passages)
+        return client.agents.passages.list(agent_id, **kwargs)
+
+    if pretty:
+        separator = b",\n    "
+        head = b'{\n  "agent_id": ' + to_json(agent_id) + b',\n  "passages": ['
+    else:
+        separator = b","
+        head = b'{"agent_id":' + to_json(agent_id) + b',"passages":['
+
+    def encode(passage_data: dict[str, Any]) -> bytes:
+        if not pretty:
+            return to_json(passage_data)
+        # Nest each indented passage under "passages"
+        return to_json(passage_data, indent=2).replace(b"\n", b"\n    ")
+
+    # Stream each page straight to disk so memory stays bounded by the page size.
+    # The file is still a single {"agent_id": ..., "passages": [...]} document.
+    # It is written under a temporary name and only moved into place once
+    # complete, so a failed export never leaves a truncated file for import.
+    partial_path = output_path.with_name(output_path.name + ".partial")
+    try:
+        with open(partial_path, "wb") as f, ThreadPoolExecutor(max_workers=1) as prefetcher:
+            f.write(head)
+
+            # Paginate through all passages. Pagination is cursor-based, so pages can't
+            # be fetched in parallel, but the next request can be in flight while the
+            # current page is serialized.
+            passages_list = fetch_page(None)
+            while passages_list:
+                # If we got fewer than limit, this is the last page; otherwise use the
+                # last passage ID as cursor for the next one
+                next_page = None
+                if len(passages_list) >= limit:
+                    next_page = prefetcher.submit(fetch_page, passages_list[-1].id)
+
+                # Encode the whole page and write it in one call
+                page = separator.join(
+                    encode(
+                        {
+                            "id": p.id,
+                            "text": p.text,
+                            "created_at": p.created_at.isoformat() if p.created_at else None,
+                            "metadata": p.metadata,
+                            "tags": p.tags,
+                        }
+                    )
+                    for p in passages_list
+                )
+                f.write((separator if count else separator.lstrip(b",")) + page)
+                count += len(passages_list)
+
+                if next_page is None:
+                    break
+                passages_list = next_page.result()
+
+            f.write(b"\n  ]\n}\n" if pretty and count else b"]\n}\n" if pretty else b"]}\n")
+
+        partial_path.replace(output_path)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+
+    logger.info("Exported %d passages to %s", count, output_path)
+    return count
 
 
 def export_agent(
@@ -116,6 +159,7 @@ def export_agent(
     source_url: str | None = None,
     api_key: str | None = None,
     output_dir: Path | None = None,
+    pretty: bool = False,
 ) -> ExportResult:
     """Export an agent and its archival memory from Letta.
 
@@ -124,6 +168,7 @@ def export_agent(
         source_url: Source Letta server URL (default: from settings)
         api_key: API key for source server (default: from settings)
         output_dir: Directory for export files (default: ./exports)
+        pretty: Indent the passages JSON for readability (default: compact)
 
     Returns:
         ExportResult with paths to exported files
@@ -140,11 +185,11 @@ def export_agent(
         output_dir = Path("exports")
     output_dir.mkdir(exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     agent_file_path = output_dir / f"nameless_{timestamp}.af"
     passages_file_path = output_dir / f"nameless_{timestamp}_passages.json"
 
-    logger.info(f"Exporting agent {agent_id} from {base_url}")
+    logger.info("Exporting agent %s from %s", agent_id, base_url)
 
     # Create client
     client = create_letta_client(base_url, api_key)
@@ -156,21 +201,21 @@ def export_agent(
     with open(agent_file_path, "w") as f:
         f.write(agent_file_content)
 
-    logger.info(f"Agent file exported to {agent_file_path}")
+    logger.info("Agent file exported to %s", agent_file_path)
 
     # Parse agent file to get message count
     message_count = None
     try:
-        agent_data = json.loads(agent_file_content)
+        agent_data = from_json(agent_file_content)
         messages = agent_data.get("messages", [])
         message_count = len(messages)
-        logger.info(f"  - Messages: {message_count}")
-        logger.info(f"  - Memory blocks: {len(agent_data.get('memory', {}).get('blocks', []))}")
-    except json.JSONDecodeError:
+        logger.info("  - Messages: %d", message_count)
+        logger.info("  - Memory blocks: %d", len(agent_data.get("memory", {}).get("blocks", [])))
+    except ValueError:
         logger.warning("Could not parse agent file for summary")
 
     # Export archival memory passages
-    passage_count = export_passages(client, agent_id, passages_file_path)
+    passage_count = export_passages(client, agent_id, passages_file_path, pretty=pretty)
 
     return ExportResult(
         agent_file_path=agent_file_path,
@@ -216,6 +261,11 @@ Examples:
         type=Path,
         help="Output directory for export files (default: ./exports)",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the passages JSON for readability (default: compact)",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -242,6 +292,7 @@ Examples:
             source_url=args.source_url,
             api_key=args.api_key,
             output_dir=args.output_dir,
+            pretty=args.pretty,
         )
 
         print("\nExport complete!")
@@ -253,9 +304,9 @@ Examples:
 
     except Exception as e:
         if args.verbose:
-            logger.exception(f"Export failed: {e}")
+            logger.exception("Export failed: %s", e)
         else:
-            logger.error(f"Export failed: {e}")
+            logger.error("Export failed: %s", e)
         sys.exit(1)
 
 
@@ -7,19 +7,47 @@ Usage:
     nameless-import exports/nameless_20240115.af --target-url https://api.letta.com --api-key <key>
 """
 
+from __future__ import annotations
+
 import argparse
-import json
 import logging
 import sys
+import tempfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass
+from itertools import chain, islice
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from letta_client import Letta
+from pydantic_core import from_json, to_json
 
 from nameless.config import get_settings
 
+if TYPE_CHECKING:
+    from letta_client import Letta
+    from letta_client.types.archives.passage_create_many_params import Passage
+
 logger = logging.getLogger(__name__)
 
+# Number of passage uploads kept in flight at once
+DEFAULT_MAX_WORKERS = 10
+
+# Passages per request when the batch endpoint is available
+BATCH_SIZE = 100
+
+# Passages files larger than this are parsed incrementally instead of loaded whole
+STREAMING_THRESHOLD_BYTES = 256 * 1024 * 1024
+
+# Passages files with these suffixes hold one JSON passage per line
+NDJSON_SUFFIXES = (".jsonl", ".ndjson")
+
+# Passages files larger than this are split into shards uploaded by separate processes
+SHARDING_THRESHOLD_BYTES = 512 * 1024 * 1024
+
+# Approximate size of each shard written when splitting a passages file
+SHARD_SIZE_BYTES = 128 * 1024 * 1024
+
 
 @dataclass
 class ImportResult:
@@ -40,55 +68,323 @@ def create_letta_client(base_url: str, api_key: str | None = None) -> Letta:
     Returns:
         Configured Letta client
     """
+    from letta_client import Letta
+
     kwargs: dict = {"base_url": base_url}
     if api_key:
         kwargs["api_key"] = api_key
     return Letta(**kwargs)
 
 
-def import_passages(client: Letta, agent_id: str, passages_file: Path) -> int:
+def _resolve_target(target_url: str | None, api_key: str | None) -> tuple[str, str | None]:
+    """Fill in the target server URL and API key from settings where not given."""
+    settings = get_settings()
+
+    # Use provided URL or fall back to settings
+    base_url = target_url or settings.letta.base_url
+    if api_key is None:
+        api_key = settings.letta.api_key
+    return base_url, api_key
+
+
+def _passage_params(passage: dict[str, Any]) -> Passage:
+    """Build create parameters for an exported passage."""
+    params: Passage = {"text": passage["text"]}
+    if passage.get("tags"):
+        params["tags"] = passage["tags"]
+    return params
+
+
+def _chunks(items: Iterable[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    """Yield successive lists of at most ``size`` items."""
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def _read_passages(passages_file: Path) -> Iterator[dict[str, Any]]:
+    """Yield passages from an export file one at a time.
+
+    NDJSON files are read a line at a time. For JSON exports, files up to
+    STREAMING_THRESHOLD_BYTES are parsed in one go, which is fastest; larger
+    files are parsed incrementally so memory use doesn't grow with the number
+    of passages.
+    """
+    if passages_file.suffix in NDJSON_SUFFIXES:
+        with open(passages_file, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield from_json(line)
+        return
+
+    if passages_file.stat().st_size <= STREAMING_THRESHOLD_BYTES:
+        yield from from_json(passages_file.read_bytes()).get("passages", [])
+        return
+
+    import ijson
+
+    with open(passages_file, "rb") as f:
+        yield from ijson.items(f, "passages.item")
+
+
+def _shard_passages(passages_file: Path, shard_dir: Path, shard_size_bytes: int) -> list[Path]:
+    """Split a passages file into NDJSON shards of roughly ``shard_size_bytes`` each.
+
+    The input is streamed, and only the fields the import uses are written, so
+    neither the input nor a shard is ever held in memory.
+
+    Returns:
+        Paths of the shards written to shard_dir, in order
+    """
+
+    def encode(passage: dict[str, Any]) -> bytes:
+        return to_json(_passage_params(passage)) + b"\n"
+
+    passages = iter(_read_passages(passages_file))
+    shards: list[Path] = []
+    count = 0
+    # Each shard starts with the next unread passage and takes passages until it's full
+    for first in passages:
+        shards.append(shard_dir / f"passages_{len(shards):04d}.jsonl")
+        with open(shards[-1], "wb") as shard:
+            written = 0
+            for passage in chain([first], passages):
+                written += shard.write(encode(passage))
+                count += 1
+                if written >= shard_size_bytes:
+                    break
+
+    logger.info("Split %d passages into %d shards", count, len(shards))
+    return shards
+
+
+def _agent_archive_id(client: Letta, agent_id: str) -> str | None:
+    """Find the archive backing an agent's archival memory, if it has one yet."""
+    from letta_client import APIStatusError
+
+    try:
+        archive = next(iter(client.archives.list(agent_id=agent_id, limit=1)), None)
+    except (AttributeError, APIStatusError) as e:
+        # SDK or server without a usable archives API; passages go in one by one
+        logger.debug("Could not look up the agent's archive: %s", e)
+        return None
+    return archive.id if archive else None
+
+
+def _create_passage(client: Letta, agent_id: str, passage: dict[str, Any]) -> None:
+    """Create a single passage in an agent's archival memory."""
+    from letta_client import omit
+
+    client.agents.passages.create(agent_id, text=passage["text"], tags=passage.get("tags") or omit)
+
+
+def _import_passages_batched(
+    client: Letta, agent_id: str, archive_id: str, batches: Iterable[list[dict[str, Any]]]
+) -> int | None:
+    """Create passages in an archive, one request per batch.
+
+    A batch that fails is retried one passage at a time, so a single bad
+    passage only loses itself rather than the whole batch.
+
+    Returns:
+        Number of passages imported, or None if batch creation isn't supported
+        by the SDK or server. Support is only judged by the first request, so
+        None means nothing beyond the first batch was consumed.
+    """
+    from letta_client import APIStatusError
+
+    imported = 0
+    for attempted, batch in enumerate(batches):
+        try:
+            created = client.archives.passages.create_many(archive_id, passages=[_passage_params(p) for p in batch])
+        except Exception as e:
+            unsupported = isinstance(e, AttributeError) or (
+                isinstance(e, APIStatusError) and e.status_code in (404, 405)
+            )
+            if attempted == 0 and unsupported:
+                logger.info("Batch passage creation not supported, importing passages individually")
+                return None
+            logger.warning("Failed to import batch of %d passages, retrying individually: %s", len(batch), e)
+            for passage in batch:
+                try:
+                    _create_passage(client, agent_id, passage)
+                except Exception as passage_error:
+                    logger.warning("Failed to import passage: %s", passage_error)
+                    continue
+                imported += 1
+        else:
+            imported += len(created)
+        logger.info("  Imported %d passages...", imported)
+
+    return imported
+
+
+def _import_passages_concurrently(
+    client: Letta, agent_id: str, passages: Iterable[dict[str, Any]], max_workers: int
+) -> int:
+    """Create passages one request each, overlapping requests on a thread pool."""
+    imported = 0
+    next_log = 50
+
+    def collect(done: set[Future[None]]) -> None:
+        nonlocal imported, next_log
+        for future in done:
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning("Failed to import passage: %s", e)
+                continue
+
+            imported += 1
+            if imported == next_log:
+                logger.info("  Imported %d passages...", imported)
+                next_log += 50
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: set[Future[None]] = set()
+        for passage in passages:
+            # Keep a bounded number of uploads queued rather than one per passage
+            if len(pending) >= max_workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending.add(executor.submit(_create_passage, client, agent_id, passage))
+
+        collect(wait(pending).done)
+
+    return imported
+
+
+def import_passages(
+    client: Letta,
+    agent_id: str,
+    passages_file: Path,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> int:
     """Import archival memory passages for an agent.
 
+    Passages are created BATCH_SIZE at a time through the archive batch
+    endpoint. Letta only creates an agent's archive with its first passage, so
+    for a new agent the first passage is created on its own before looking the
+    archive up again. If there's still no archive (or the batch endpoint is
+    unavailable) each passage is a separate create request, and uploads run
+    concurrently on a thread pool to overlap their network round-trips.
+    Rate-limited (429) responses are retried with backoff by the Letta client
+    itself.
+
     Args:
         client: Letta client
         agent_id: The agent ID to import passages into
-        passages_file: Path to the passages JSON file
+        passages_file: Path to the passages JSON file, or an NDJSON file
+            (``.jsonl``/``.ndjson``) with one passage per line
+        max_workers: Maximum number of concurrent uploads
 
     Returns:
         Number of passages imported
     """
     if not passages_file.exists():
-        logger.warning(f"Passages file not found: {passages_file}")
+        logger.warning("Passages file not found: %s", passages_file)
         return 0
 
-    logger.info(f"Importing archival memory passages from {passages_file}")
+    logger.info("Importing archival memory passages from %s", passages_file)
 
-    with open(passages_file) as f:
-        data = json.load(f)
+    total = 0
 
-    passages = data.get("passages", [])
-    if not passages:
+    def counted(items: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        nonlocal total
+        for item in items:
+            total += 1
+            yield item
+
+    passages = counted(_read_passages(passages_file))
+    first = next(passages, None)
+    if first is None:
         logger.info("No passages to import")
         return 0
 
-    imported = 0
-    for passage in passages:
+    created_first = 0
+    archive_id = _agent_archive_id(client, agent_id)
+    if archive_id is None:
+        # A new agent's archive only exists once it has a passage, so create one and look again
         try:
-            # Create passage in the new agent
-            kwargs: dict = {"text": passage["text"]}
-            if passage.get("tags"):
-                kwargs["tags"] = passage["tags"]
+            _create_passage(client, agent_id, first)
+            created_first = 1
+        except Exception as e:
+            logger.warning("Failed to import passage: %s", e)
+        else:
+            archive_id = _agent_archive_id(client, agent_id)
+    else:
+        passages = chain([first], passages)
+
+    imported = None
+    if archive_id is not None:
+        batches = _chunks(passages, BATCH_SIZE)
+        first_batch = next(batches, None)
+        if first_batch is None:
+            imported = 0
+        else:
+            imported = _import_passages_batched(client, agent_id, archive_id, chain([first_batch], batches))
+            if imported is None:
+                # Batching was rejected on the first request, so nothing else was consumed
+                passages = chain(first_batch, chain.from_iterable(batches))
+    if imported is None:
+        imported = _import_passages_concurrently(client, agent_id, passages, max_workers)
+    imported += created_first
+
+    logger.info("Imported %d/%d passages", imported, total)
+    return imported
 
-            client.agents.passages.create(agent_id, **kwargs)
-            imported += 1
 
-            if imported % 50 == 0:
-                logger.info(f"  Imported {imported}/{len(passages)} passages...")
+def _upload_shard(shard: Path, agent_id: str, base_url: str, api_key: str | None, max_workers: int) -> int:
+    """Import one passages shard in a worker process, using a client of its own."""
+    client = create_letta_client(base_url, api_key)
+    try:
+        return import_passages(client, agent_id, shard, max_workers=max_workers)
+    finally:
+        client.close()
 
-        except Exception as e:
-            logger.warning(f"Failed to import passage: {e}")
 
-    logger.info(f"Imported {imported}/{len(passages)} passages")
+def import_passages_sharded(
+    agent_id: str,
+    passages_file: Path,
+    base_url: str,
+    api_key: str | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    processes: int | None = None,
+) -> int:
+    """Import a very large passages file by splitting it across processes.
+
+    The file is split into SHARD_SIZE_BYTES NDJSON shards next to it, and each
+    shard is imported by a worker process with its own Letta client, so
+    parsing and uploads aren't bound to a single interpreter or connection
+    pool. Shards are removed once the import finishes.
+
+    Args:
+        agent_id: The agent ID to import passages into
+        passages_file: Path to the passages JSON or NDJSON file
+        base_url: Letta server URL for the worker clients
+        api_key: API key for the worker clients
+        max_workers: Maximum number of concurrent uploads per process
+        processes: Number of worker processes (default: one per CPU)
+
+    Returns:
+        Number of passages imported
+    """
+    logger.info("Importing archival memory passages from %s in shards", passages_file)
+
+    imported = 0
+    with tempfile.TemporaryDirectory(prefix=".passages_shards_", dir=passages_file.parent) as shard_dir:
+        shards = _shard_passages(passages_file, Path(shard_dir), SHARD_SIZE_BYTES)
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [
+                executor.submit(_upload_shard, shard, agent_id, base_url, api_key, max_workers) for shard in shards
+            ]
+            for future in as_completed(futures):
+                try:
+                    imported += future.result()
+                except Exception as e:
+                    logger.warning("Failed to import passages shard: %s", e)
+
+    logger.info("Imported %d passages from %d shards", imported, len(shards))
     return imported
 
 
@@ -100,6 +396,9 @@ def import_agent(
     name: str | None = None,
     model: str | None = None,
     embedding: str | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    processes: int | None = None,
+    client: Letta | None = None,
 ) -> ImportResult:
     """Import an agent and its archival memory into Letta.
 
@@ -111,16 +410,16 @@ def import_agent(
         name: Override agent name
         model: Override LLM model
         embedding: Override embedding model
+        max_workers: Maximum number of concurrent passage uploads
+        processes: Worker processes for passages files over
+            SHARDING_THRESHOLD_BYTES (default: one per CPU)
+        client: Existing Letta client to reuse, e.g. across several imports
+            (default: one is created for target_url/api_key)
 
     Returns:
         ImportResult with the new agent ID
     """
-    settings = get_settings()
-
-    # Use provided URL or fall back to settings
-    base_url = target_url or settings.letta.base_url
-    if api_key is None:
-        api_key = settings.letta.api_key
+    base_url, api_key = _resolve_target(target_url, api_key)
 
     # Infer passages file if not provided
     if passages_file is None:
@@ -130,10 +429,11 @@ def import_agent(
             base_name = base_name[:-3]
         passages_file = agent_file.parent / f"{base_name}_passages.json"
 
-    logger.info(f"Importing agent from {agent_file} to {base_url}")
+    logger.info("Importing agent from %s to %s", agent_file, base_url)
 
-    # Create client
-    client = create_letta_client(base_url, api_key)
+    # Create client unless the caller already has one to share
+    if client is None:
+        client = create_letta_client(base_url, api_key)
 
     # Import agent file
     logger.info("Importing agent file...")
@@ -146,6 +446,7 @@ def import_agent(
     if embedding:
         import_kwargs["embedding"] = embedding
 
+    # Pass the open handle (not f.read()) so the upload streams from disk in chunks
     with open(agent_file, "rb") as f:
         result = client.agents.import_file(file=f, **import_kwargs)
 
@@ -153,15 +454,20 @@ def import_agent(
         raise RuntimeError("No agent ID returned from import")
 
     agent_id = result.agent_ids[0]
-    logger.info(f"Agent imported with ID: {agent_id}")
+    logger.info("Agent imported with ID: %s", agent_id)
 
     # Verify agent
     agent = client.agents.retrieve(agent_id)
     agent_name = agent.name if hasattr(agent, "name") else None
-    logger.info(f"  - Name: {agent_name}")
+    logger.info("  - Name: %s", agent_name)
 
-    # Import passages
-    passages_imported = import_passages(client, agent_id, passages_file)
+    # Import passages, splitting very large files across processes
+    if passages_file.exists() and passages_file.stat().st_size > SHARDING_THRESHOLD_BYTES:
+        passages_imported = import_passages_sharded(
+            agent_id, passages_file, base_url, api_key, max_workers=max_workers, processes=processes
+        )
+    else:
+        passages_imported = import_passages(client, agent_id, passages_file, max_workers=max_workers)
 
     return ImportResult(
         agent_id=agent_id,
@@ -177,23 +483,31 @@ def verify_agent(client: Letta, agent_id: str) -> None:
         client: Letta client
         agent_id: The agent ID to verify
     """
-    logger.info(f"Verifying agent {agent_id}...")
+    logger.info("Verifying agent %s...", agent_id)
 
-    agent = client.agents.retrieve(agent_id)
-    logger.info(f"  - Name: {getattr(agent, 'name', 'Unknown')}")
-    logger.info(f"  - Created: {getattr(agent, 'created_at', 'Unknown')}")
+    # Blocks come back with the agent itself; probe archival memory alongside it.
+    # There's no cheap total count, but we can check if any passages exist.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        first_passage = executor.submit(lambda: next(iter(client.agents.passages.list(agent_id, limit=1)), None))
+        agent = client.agents.retrieve(agent_id, include=["agent.blocks"])
 
-    # Check memory blocks
-    blocks = list(client.agents.blocks.list(agent_id))
-    logger.info(f"  - Memory blocks: {len(blocks)}")
+    logger.info("  - Name: %s", getattr(agent, "name", "Unknown"))
+    logger.info("  - Created: %s", getattr(agent, "created_at", "Unknown"))
+
+    blocks = agent.blocks or []
     for block in blocks:
-        logger.info(f"    - {block.label}: {len(block.value or '')} chars")
+        logger.info("    - %s: %d chars", block.label, len(block.value or ""))
+    logger.info("  - Memory blocks: %d", len(blocks))
+
+    logger.info("  - Has archival memory: %s", first_passage.result() is not None)
+
 
-    # Check passages
-    passages = list(client.agents.passages.list(agent_id, limit=1))
-    # Can't easily get total count, but we can check if any exist
-    has_passages = len(passages) > 0
-    logger.info(f"  - Has archival memory: {has_passages}")
+def _positive_int(value: str) -> int:
+    """Parse a command-line count that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def main() -> None:
@@ -215,6 +529,9 @@ Examples:
   # Import with explicit passages file
   nameless-import exports/nameless.af --passages exports/nameless_passages.json
 
+  # Import passages from a newline-delimited JSON file
+  nameless-import exports/nameless.af --passages exports/nameless_passages.jsonl
+
   # Debug connection issues
   nameless-import exports/nameless.af --verbose
         """,
@@ -223,7 +540,7 @@ Examples:
     parser.add_argument(
         "--passages",
         type=Path,
-        help="Path to passages JSON file (default: inferred from agent file name)",
+        help="Path to passages JSON or NDJSON file (default: inferred from agent file name)",
     )
     parser.add_argument(
         "--target-url",
@@ -246,6 +563,17 @@ Examples:
         "--embedding",
         help="Override embedding model",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=_positive_int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Maximum concurrent passage uploads (default: {DEFAULT_MAX_WORKERS})",
+    )
+    parser.add_argument(
+        "--processes",
+        type=_positive_int,
+        help="Worker processes for very large passages files (default: one per CPU)",
+    )
     parser.add_argument(
         "--verify",
         action="store_true",
@@ -272,24 +600,28 @@ Examples:
         logging.getLogger("httpcore").setLevel(logging.DEBUG)
 
     if not args.agent_file.exists():
-        logger.error(f"Agent file not found: {args.agent_file}")
+        logger.error("Agent file not found: %s", args.agent_file)
         sys.exit(1)
 
     try:
+        # One client for the import and verification, so --verify reuses its connections
+        base_url, api_key = _resolve_target(args.target_url, args.api_key)
+        client = create_letta_client(base_url, api_key)
+
         result = import_agent(
             args.agent_file,
             passages_file=args.passages,
-            target_url=args.target_url,
-            api_key=args.api_key,
+            target_url=base_url,
+            api_key=api_key,
             name=args.name,
             model=args.model,
             embedding=args.embedding,
+            max_workers=args.max_workers,
+            processes=args.processes,
+            client=client,
         )
 
         if args.verify:
-            settings = get_settings()
-            base_url = args.target_url or settings.letta.base_url
-            client = create_letta_client(base_url, args.api_key)
             verify_agent(client, result.agent_id)
 
         print("\nImport complete!")
@@ -301,9 +633,9 @@ Examples:
 
     except Exception as e:
         if args.verbose:
-            logger.exception(f"Import failed: {e}")
+            logger.exception("Import failed: %s", e)
         else:
-            logger.error(f"Import failed: {e}")
+            logger.error("Import failed: %s", e)
         sys.exit(1)
 
 
@@ -6,8 +6,26 @@ Triggers are the entry points that wake Nameless up:
 - bluesky: Bluesky notifications and mentions
 """
 
-from nameless.triggers.bluesky import BlueskyTrigger
-from nameless.triggers.cron import CronTrigger
-from nameless.triggers.discord import DiscordTrigger
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from nameless.triggers.bluesky import BlueskyTrigger
+    from nameless.triggers.cron import CronTrigger
+    from nameless.triggers.discord import DiscordTrigger
 
 __all__ = ["CronTrigger", "DiscordTrigger", "BlueskyTrigger"]
+
+# Submodule defining each trigger, imported on first access
+_TRIGGER_MODULES = {
+    "CronTrigger": "cron",
+    "DiscordTrigger": "discord",
+    "BlueskyTrigger": "bluesky",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _TRIGGER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{module}"), name)
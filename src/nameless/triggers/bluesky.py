@@ -6,11 +6,16 @@ Uses the AT Protocol via the atproto library.
 
 import logging
 from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
 
 from nameless.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Where the authenticated session is kept between runs, so polling doesn't log in every time
+SESSION_CACHE_PATH = Path.home() / ".cache" / "nameless" / "bsky_session.txt"
+
 
 class BlueskyTrigger:
     """Handles Bluesky/AT Protocol interactions for Nameless."""
@@ -29,12 +34,56 @@ class BlueskyTrigger:
 
         from atproto import Client
 
-        self._client = Client()
-        self._client.login(self.settings.bluesky.handle, self.settings.bluesky.app_password)
+        client = Client()
+        # Persist new and refreshed sessions for the next run
+        client.on_session_change(self._save_session)
+
+        if not self._resume_session(client):
+            client.login(self.settings.bluesky.handle, self.settings.bluesky.app_password)
         logger.info(f"Authenticated to Bluesky as {self.settings.bluesky.handle}")
 
+        self._client = client
         return self._client
 
+    def _resume_session(self, client: Any) -> bool:
+        """Log in with the cached session, if there is a usable one.
+
+        Returns:
+            True if the client is now authenticated as the configured handle
+        """
+        from atproto import Session
+
+        try:
+            session_string = SESSION_CACHE_PATH.read_text()
+            cached_handle = Session.decode(session_string).handle
+        except (OSError, ValueError):
+            return False
+
+        # A session cached for another account must not be resumed
+        if cached_handle != self.settings.bluesky.handle:
+            logger.info(f"Cached Bluesky session is for {cached_handle}, logging in again")
+            return False
+
+        try:
+            client.login(session_string=session_string)
+        except Exception as e:
+            logger.info(f"Cached Bluesky session unusable, logging in again: {e}")
+            return False
+
+        return True
+
+    @staticmethod
+    def _save_session(event: Any, session: Any) -> None:
+        """Write the current session to SESSION_CACHE_PATH."""
+        try:
+            SESSION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            SESSION_CACHE_PATH.touch(mode=0o600, exist_ok=True)
+            # touch() only applies the mode to a new file; tighten an existing one too
+            SESSION_CACHE_PATH.chmod(0o600)
+            SESSION_CACHE_PATH.write_text(session.export())
+        except OSError as e:
+            logger.warning(f"Could not cache Bluesky session: {e}")
+
     def post(self, text: str) -> str:
         """Post a skeet to Bluesky.
 
@@ -5,14 +5,15 @@ memory consolidation, and autonomous thought.
 """
 
 import asyncio
+import contextlib
 import logging
-import time
 from datetime import datetime
-
-import schedule
+from typing import TYPE_CHECKING
 
 from nameless.config import get_settings
-from nameless.core import NamelessAgent
+
+if TYPE_CHECKING:
+    from nameless.core import NamelessAgent
 
 logger = logging.getLogger(__name__)
 
@@ -39,9 +40,11 @@ class CronTrigger:
     def __init__(self) -> None:
         self.settings = get_settings()
         self._running = False
-        self._agent = NamelessAgent()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stop_event: asyncio.Event | None = None
+        self._agent: NamelessAgent | None = None
 
-    def perch_time(self) -> None:
+    async def perch_time(self) -> None:
         """Execute a perch time cycle.
 
         This is Nameless's moment for:
@@ -54,13 +57,21 @@ class CronTrigger:
         logger.info(f"Perch time triggered at {timestamp}")
 
         # Run the agent loop
-        asyncio.run(self._run_perch_cycle())
+        await self._run_perch_cycle()
 
         logger.info("Perch time cycle complete")
 
     async def _run_perch_cycle(self) -> None:
-        """Run the perch time cycle using the agent."""
+        """Run the perch time cycle using the agent.
+
+        The agent (and its Letta client) is created on the first cycle and
+        reused for every cycle after that.
+        """
         try:
+            if self._agent is None:
+                from nameless.core import NamelessAgent
+
+                self._agent = NamelessAgent()
             responses = await self._agent.run_and_collect(PERCH_TIME_PROMPT)
             for response in responses:
                 if response.get("type") == "text":
@@ -68,24 +79,47 @@ class CronTrigger:
         except Exception as e:
             logger.error(f"Perch time cycle failed: {e}")
 
-    def start(self) -> None:
-        """Start the periodic scheduler."""
+    async def run(self) -> None:
+        """Run perch time cycles every perch_interval_hours until stopped.
+
+        All cycles share one event loop, so the agent's Letta client keeps its
+        connection pool alive between perches.
+        """
         interval = self.settings.triggers.perch_interval_hours
         logger.info(f"Starting perch time scheduler (every {interval} hours)")
 
-        schedule.every(interval).hours.do(self.perch_time)
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        self._running = True
 
-        # Run immediately on start
-        self.perch_time()
+        # Run immediately on start, then keep a fixed cadence from each start time
+        next_run = self._loop.time()
+        try:
+            while self._running:
+                next_run += interval * 3600
+                await self.perch_time()
+
+                # Sleep until the next cycle is due; stop() wakes us early
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=max(0.0, next_run - self._loop.time()))
+        finally:
+            # The client belongs to this loop, so close it here rather than in stop()
+            if self._agent is not None:
+                await self._agent.close()
+                self._agent = None
 
-        self._running = True
-        while self._running:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+    def start(self) -> None:
+        """Start the periodic scheduler."""
+        asyncio.run(self.run())
 
     def stop(self) -> None:
-        """Stop the scheduler."""
+        """Stop the scheduler.
+
+        Safe to call from another thread or after the loop has exited.
+        """
         self._running = False
+        if self._loop is not None and self._stop_event is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._stop_event.set)
         logger.info("Perch time scheduler stopped")
 
 
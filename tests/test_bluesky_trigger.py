@@ -0,0 +1,161 @@
+"""Tests for the Bluesky trigger's session caching."""
+
+import stat
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from atproto import Session
+
+from nameless.triggers.bluesky import BlueskyTrigger
+
+HANDLE = "nameless.bsky.social"
+
+
+class FakeClient:
+    """Stand-in for atproto.Client that records logins."""
+
+    def __init__(self, session_error: Exception | None = None) -> None:
+        self.session_error = session_error
+        self.logins: list[dict[str, Any]] = []
+        self.session_callbacks: list[Any] = []
+        # Like a PDS that doesn't serve app.bsky, the profile is never fetched
+        self.me = None
+
+    def on_session_change(self, callback: Any) -> None:
+        self.session_callbacks.append(callback)
+
+    def login(self, login: str | None = None, password: str | None = None, session_string: str | None = None) -> None:
+        if session_string is not None:
+            self.logins.append({"session_string": session_string})
+            if self.session_error is not None:
+                raise self.session_error
+        else:
+            self.logins.append({"login": login, "password": password})
+
+
+def session_string(handle: str = HANDLE) -> str:
+    """Encode a session for the given handle the way the client exports it."""
+    return Session(handle, "did:plc:nameless", "access-jwt", "refresh-jwt").export()
+
+
+@pytest.fixture
+def session_path(tmp_path: Path) -> Any:
+    """Point SESSION_CACHE_PATH at a file under tmp_path."""
+    path = tmp_path / "nameless" / "bsky_session.txt"
+    with patch("nameless.triggers.bluesky.SESSION_CACHE_PATH", path):
+        yield path
+
+
+def make_trigger() -> BlueskyTrigger:
+    trigger = BlueskyTrigger()
+    trigger.settings = MagicMock()
+    trigger.settings.bluesky.handle = HANDLE
+    trigger.settings.bluesky.app_password = "app-password"
+    return trigger
+
+
+def connect(client: FakeClient) -> BlueskyTrigger:
+    """Run _get_client with atproto.Client replaced by the given fake."""
+    trigger = make_trigger()
+    with patch("atproto.Client", return_value=client):
+        assert trigger._get_client() is client
+    return trigger
+
+
+PASSWORD_LOGIN = {"login": HANDLE, "password": "app-password"}
+
+
+class TestSessionResume:
+    """Tests for resuming a cached session in _get_client."""
+
+    def test_resumes_cached_session(self, session_path: Path) -> None:
+        """Test that a cached session for the configured handle skips the password login."""
+        session_path.parent.mkdir(parents=True)
+        session_path.write_text(session_string())
+        client = FakeClient()
+
+        trigger = connect(client)
+
+        assert client.logins == [{"session_string": session_string()}]
+        assert client.session_callbacks == [trigger._save_session]
+
+    def test_missing_cache_logs_in_with_password(self, session_path: Path) -> None:
+        """Test that no cache file goes straight to the password login."""
+        client = FakeClient()
+
+        connect(client)
+
+        assert client.logins == [PASSWORD_LOGIN]
+
+    def test_unreadable_cache_logs_in_with_password(self, session_path: Path) -> None:
+        """Test that a cache path that can't be read is treated as no cache."""
+        session_path.mkdir(parents=True)  # reading a directory raises IsADirectoryError
+        client = FakeClient()
+
+        connect(client)
+
+        assert client.logins == [PASSWORD_LOGIN]
+
+    def test_malformed_cache_logs_in_with_password(self, session_path: Path) -> None:
+        """Test that a cache file that isn't a session string is ignored."""
+        session_path.parent.mkdir(parents=True)
+        session_path.write_text("not a session")
+        client = FakeClient()
+
+        connect(client)
+
+        assert client.logins == [PASSWORD_LOGIN]
+
+    def test_rejected_session_logs_in_with_password(self, session_path: Path) -> None:
+        """Test that a session login error falls back to the password login."""
+        session_path.parent.mkdir(parents=True)
+        session_path.write_text(session_string())
+        client = FakeClient(session_error=RuntimeError("ExpiredToken"))
+
+        connect(client)
+
+        assert client.logins == [{"session_string": session_string()}, PASSWORD_LOGIN]
+
+    def test_other_handle_logs_in_with_password(self, session_path: Path) -> None:
+        """Test that a session cached for a different account is never used."""
+        session_path.parent.mkdir(parents=True)
+        session_path.write_text(session_string("someone-else.bsky.social"))
+        client = FakeClient()
+
+        connect(client)
+
+        assert client.logins == [PASSWORD_LOGIN]
+
+
+class TestSaveSession:
+    """Tests for BlueskyTrigger._save_session."""
+
+    def test_writes_owner_only_file(self, session_path: Path) -> None:
+        """Test that the session is written, creating the directory, readable only by the owner."""
+        BlueskyTrigger._save_session("create", SimpleNamespace(export=lambda: "new-session"))
+
+        assert session_path.read_text() == "new-session"
+        assert stat.S_IMODE(session_path.stat().st_mode) == 0o600
+
+    def test_tightens_existing_file(self, session_path: Path) -> None:
+        """Test that an existing world-readable cache file is made owner-only before tokens go in."""
+        session_path.parent.mkdir(parents=True)
+        session_path.write_text("old-session")
+        session_path.chmod(0o644)
+
+        BlueskyTrigger._save_session("refresh", SimpleNamespace(export=lambda: "new-session"))
+
+        assert session_path.read_text() == "new-session"
+        assert stat.S_IMODE(session_path.stat().st_mode) == 0o600
+
+    def test_write_errors_are_logged(self, session_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that failing to cache the session doesn't raise."""
+        session_path.parent.parent.mkdir(parents=True, exist_ok=True)
+        session_path.parent.write_text("not a directory")
+
+        BlueskyTrigger._save_session("refresh", SimpleNamespace(export=lambda: "new-session"))
+
+        assert "Could not cache Bluesky session" in caplog.text
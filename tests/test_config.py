@@ -40,6 +40,24 @@ def test_settings_from_env():
         assert settings.triggers.perch_interval_hours == 4
 
 
+def test_multi_word_fields_from_env():
+    """Test that fields containing underscores map to the right section."""
+    env = {
+        "BLUESKY_APP_PASSWORD": "app-pw",
+        "DISCORD_BOT_TOKEN": "token",
+        "DISCORD_GUILD_ID": "guild-1",
+        "ANTHROPIC_API_KEY": "sk-test",
+    }
+
+    with patch.dict(os.environ, env, clear=True):
+        settings = Settings()
+
+        assert settings.bluesky.app_password == "app-pw"
+        assert settings.discord.bot_token == "token"
+        assert settings.discord.guild_id == "guild-1"
+        assert settings.anthropic_api_key == "sk-test"
+
+
 def test_get_settings_cached():
     """Test that get_settings returns cached instance."""
     get_settings.cache_clear()
@@ -48,3 +66,18 @@ def test_get_settings_cached():
     settings2 = get_settings()
 
     assert settings1 is settings2
+
+
+def test_field_names_are_not_env_names():
+    """Test that sections are only read from their documented prefixes, not their field names."""
+    env = {
+        "AGENT_AGENT_ID": "agent-from-field-name",
+        "TRIGGERS_INTERVAL_HOURS": "7",
+        "TRIGGERS_PERCH_INTERVAL_HOURS": "8",
+    }
+
+    with patch.dict(os.environ, env, clear=True):
+        settings = Settings(_env_file=None)
+
+        assert settings.agent.agent_id is None
+        assert settings.triggers.perch_interval_hours == 2
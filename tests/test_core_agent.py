@@ -0,0 +1,65 @@
+"""Tests for the NamelessAgent wrapper around Claude Agent SDK."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from nameless.core.agent import (
+    DEFAULT_SYSTEM_PROMPT,
+    LETTA_ALLOWED_TOOLS,
+    PERSONA_CACHE_TTL_SECONDS,
+    NamelessAgent,
+)
+
+
+class TestBuildOptions:
+    """Tests for NamelessAgent._build_options."""
+
+    def test_substitutes_system_prompt(self) -> None:
+        """Test that each call gets its own system prompt."""
+        agent = NamelessAgent(agent_id="agent-123", _client=MagicMock())
+
+        first = agent._build_options("first prompt")
+        second = agent._build_options("second prompt")
+
+        assert first.system_prompt == "first prompt"
+        assert second.system_prompt == "second prompt"
+        assert first.allowed_tools == list(LETTA_ALLOWED_TOOLS)
+
+    def test_reuses_mcp_server(self) -> None:
+        """Test that the MCP server is built once per agent."""
+        agent = NamelessAgent(agent_id="agent-123", _client=MagicMock())
+
+        first = agent._build_options("prompt")
+        second = agent._build_options("prompt")
+
+        assert first is not second
+        assert first.mcp_servers["letta"] is second.mcp_servers["letta"]
+
+
+class TestLoadPersonaFromLetta:
+    """Tests for NamelessAgent.load_persona_from_letta."""
+
+    async def test_caches_persona_between_runs(self) -> None:
+        """Test that a loaded persona is reused until the TTL expires."""
+        mock_letta = MagicMock()
+        mock_letta.agents.blocks.retrieve = AsyncMock(return_value=MagicMock(value="I am Nameless."))
+        agent = NamelessAgent(agent_id="agent-123", _client=mock_letta)
+
+        assert await agent.load_persona_from_letta() == "I am Nameless."
+        assert await agent.load_persona_from_letta() == "I am Nameless."
+        assert mock_letta.agents.blocks.retrieve.call_count == 1
+
+        # Age the cache entry past the TTL
+        loaded_at, persona = agent._persona_cache
+        agent._persona_cache = (loaded_at - PERSONA_CACHE_TTL_SECONDS, persona)
+
+        await agent.load_persona_from_letta()
+        assert mock_letta.agents.blocks.retrieve.call_count == 2
+
+    async def test_does_not_cache_fallback(self) -> None:
+        """Test that a failed load falls back without caching the default."""
+        mock_letta = MagicMock()
+        mock_letta.agents.blocks.retrieve = AsyncMock(side_effect=RuntimeError("down"))
+        agent = NamelessAgent(agent_id="agent-123", _client=mock_letta)
+
+        assert await agent.load_persona_from_letta() == DEFAULT_SYSTEM_PROMPT
+        assert agent._persona_cache is None
@@ -8,8 +8,11 @@ These mocks are based on letta-client 1.7.6 types:
 """
 
 import datetime
+from collections.abc import Iterator
+from functools import cache, reduce
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 
@@ -19,14 +22,35 @@ from letta_client.types.agents.assistant_message import AssistantMessage
 from letta_client.types.agents.user_message import UserMessage
 from letta_client.types.passage_search_response import PassageSearchResponseItem
 
+from nameless.core.tools import _format_message, create_letta_mcp_server
 
+# Timestamps used by the helpers and tests (datetimes are immutable, so share them)
+DEFAULT_PASSAGE_DATE = datetime.datetime(2024, 1, 15, 10, 30, 0)
+DEFAULT_ASSISTANT_DATE = datetime.datetime(2024, 1, 15, 11, 0, 0)
+DEFAULT_USER_DATE = datetime.datetime(2024, 1, 15, 10, 59, 0)
+PASSAGE_1_DATE = datetime.datetime(2024, 1, 10, 9, 0, 0)
+PASSAGE_2_DATE = datetime.datetime(2024, 1, 12, 14, 30, 0)
+MESSAGE_1_DATE = datetime.datetime(2024, 1, 15, 10, 0, 0)
+MESSAGE_2_DATE = datetime.datetime(2024, 1, 15, 10, 0, 5)
+
+# Expected Letta client calls, built once and compared against recorded calls
+RETRIEVE_PERSONA_CALL = call("persona", agent_id="agent-123")
+
+# The make_* helpers below are cached: tests calling one with the same arguments
+# share a single instance, so each Letta model is only built once. Tests only
+# read these objects and must not mutate them. The models are built with
+# model_construct, skipping validation, since the field values here are
+# already well-formed.
+
+
+@cache
 def make_block_response(
     block_id: str = "block-123",
     label: str = "persona",
     value: str = "I am Nameless, an AI agent.",
 ) -> BlockResponse:
     """Create a realistic BlockResponse matching letta-client 1.7.6."""
-    return BlockResponse(
+    return BlockResponse.model_construct(
         id=block_id,
         value=value,
         label=label,
@@ -49,16 +73,17 @@ def make_block_response(
     )
 
 
+@cache
 def make_passage(
     passage_id: str = "passage-789",
     text: str = "A memory about something important.",
     created_at: datetime.datetime | None = None,
 ) -> Passage:
     """Create a realistic Passage matching letta-client 1.7.6."""
-    return Passage(
+    return Passage.model_construct(
         text=text,
         id=passage_id,
-        created_at=created_at or datetime.datetime(2024, 1, 15, 10, 30, 0),
+        created_at=created_at or DEFAULT_PASSAGE_DATE,
         embedding=None,
         embedding_config=None,
         archive_id="archive-001",
@@ -79,23 +104,24 @@ def make_passage_search_result(
     score: float = 0.95,
 ) -> PassageSearchResponseItem:
     """Create a realistic PassageSearchResponseItem."""
-    return PassageSearchResponseItem(
+    return PassageSearchResponseItem.model_construct(
         passage=passage or make_passage(),
         score=score,
         metadata=None,
     )
 
 
+@cache
 def make_assistant_message(
     msg_id: str = "msg-001",
     content: str = "Hello, I'm here to help.",
     date: datetime.datetime | None = None,
 ) -> AssistantMessage:
     """Create a realistic AssistantMessage matching letta-client 1.7.6."""
-    return AssistantMessage(
+    return AssistantMessage.model_construct(
         id=msg_id,
         content=content,
-        date=date or datetime.datetime(2024, 1, 15, 11, 0, 0),
+        date=date or DEFAULT_ASSISTANT_DATE,
         message_type="assistant_message",
         is_err=False,
         name=None,
@@ -107,16 +133,17 @@ def make_assistant_message(
     )
 
 
+@cache
 def make_user_message(
     msg_id: str = "msg-002",
     content: str = "Hello Nameless!",
     date: datetime.datetime | None = None,
 ) -> UserMessage:
     """Create a realistic UserMessage matching letta-client 1.7.6."""
-    return UserMessage(
+    return UserMessage.model_construct(
         id=msg_id,
         content=content,
-        date=date or datetime.datetime(2024, 1, 15, 10, 59, 0),
+        date=date or DEFAULT_USER_DATE,
         message_type="user_message",
         is_err=False,
         name=None,
@@ -128,223 +155,278 @@ def make_user_message(
     )
 
 
-class MockSyncArrayPage(list):
-    """Mock for letta_client.pagination.SyncArrayPage that behaves like a list."""
+class StubMethod:
+    """Stand-in for a single AsyncLetta client method.
 
-    def __init__(self, items: list[Any]):
-        super().__init__(items)
+    Awaiting a call returns ``return_value``; each call is recorded as a
+    ``unittest.mock.call``, without MagicMock's attribute auto-creation and
+    call introspection.
+    """
 
-    def has_next_page(self) -> bool:
-        return False
+    def __init__(self, return_value: Any = None) -> None:
+        self.return_value = return_value
+        self.calls: list[Any] = []
 
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append(call(*args, **kwargs))
+        return self.return_value
 
-class TestCreateLettaMcpServer:
-    """Tests for create_letta_mcp_server function."""
 
-    def test_requires_agent_id(self) -> None:
-        """Test that create_letta_mcp_server raises if no agent_id provided."""
-        from nameless.core.tools import create_letta_mcp_server
+def make_letta_stub() -> SimpleNamespace:
+    """Create a stub AsyncLetta client with the methods the memory tools use."""
+    return SimpleNamespace(
+        agents=SimpleNamespace(
+            blocks=SimpleNamespace(retrieve=StubMethod(), update=StubMethod(), list=StubMethod()),
+            passages=SimpleNamespace(search=StubMethod(), create=StubMethod()),
+            messages=SimpleNamespace(list=StubMethod()),
+        )
+    )
 
-        mock_letta = MagicMock()
 
-        with patch("nameless.core.tools.get_settings") as mock_settings:
-            mock_settings.return_value.agent.agent_id = None
+class MockSyncArrayPage:
+    """Mock for letta_client.pagination.SyncArrayPage that behaves like a list.
 
-            with pytest.raises(ValueError, match="No agent_id provided"):
-                create_letta_mcp_server(letta_client=mock_letta)
+    Wraps the given list rather than copying it.
+    """
 
-    def test_creates_server_with_tools(self) -> None:
-        """Test that create_letta_mcp_server returns a server with tools."""
-        from nameless.core.tools import create_letta_mcp_server
+    __slots__ = ("_items",)
 
-        mock_letta = MagicMock()
+    def __init__(self, items: list[Any]):
+        self._items = items
 
-        with patch("nameless.core.tools.get_settings") as mock_settings:
-            mock_settings.return_value.agent.agent_id = "agent-123"
-            mock_settings.return_value.letta.base_url = "http://localhost:8283"
+    def __len__(self) -> int:
+        return len(self._items)
 
-            server = create_letta_mcp_server(letta_client=mock_letta, agent_id="agent-123")
+    def __getitem__(self, index: int) -> Any:
+        return self._items[index]
 
-            # Server should be created (exact type depends on claude_agent_sdk)
-            assert server is not None
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._items)
 
+    def has_next_page(self) -> bool:
+        return False
 
-class TestGetMemoryBlock:
-    """Tests for get_memory_block tool."""
 
-    @pytest.mark.asyncio
-    async def test_retrieves_block_by_label(self) -> None:
-        """Test that get_memory_block calls Letta API correctly."""
-        from nameless.core.tools import create_letta_mcp_server
+def make_letta_tools(letta_client: Any) -> dict[str, Any]:
+    """Build the Letta memory tools around a client, keyed by tool name.
 
-        mock_letta = MagicMock()
-        mock_letta.agents.blocks.retrieve.return_value = make_block_response(
-            label="persona",
-            value="I am Nameless, exploring questions of identity.",
-        )
+    The SDK server factory is patched to hand back the tool objects, so tests
+    can call each tool's handler directly.
+    """
+    with patch(
+        "nameless.core.tools.create_sdk_mcp_server",
+        side_effect=lambda name, tools: {t.name: t for t in tools},
+    ):
+        tools: dict[str, Any] = create_letta_mcp_server(letta_client=letta_client, agent_id="agent-123")
+    return tools
 
-        with patch("nameless.core.tools.get_settings") as mock_settings:
-            mock_settings.return_value.agent.agent_id = "agent-123"
 
-            # Create server to get tool functions
-            create_letta_mcp_server(letta_client=mock_letta, agent_id="agent-123")
+def tool_text(result: dict[str, Any]) -> str:
+    """Return the text of a tool result."""
+    return str(result["content"][0]["text"])
 
-            # Directly test the Letta API call pattern
-            result = mock_letta.agents.blocks.retrieve("persona", agent_id="agent-123")
 
-            assert result.value == "I am Nameless, exploring questions of identity."
-            assert result.label == "persona"
-            mock_letta.agents.blocks.retrieve.assert_called_once_with(
-                "persona", agent_id="agent-123"
-            )
+@pytest.fixture(autouse=True, scope="module")
+def mock_settings() -> Iterator[MagicMock]:
+    """Patch the tools module's get_settings once for every test in this file.
 
+    Tests configure the settings they need on ``mock_settings.return_value``.
+    """
+    with patch("nameless.core.tools.get_settings") as mock:
+        yield mock
 
-class TestUpdateMemoryBlock:
-    """Tests for update_memory_block tool."""
 
-    @pytest.mark.asyncio
-    async def test_updates_block_value(self) -> None:
-        """Test that update_memory_block calls Letta API correctly."""
-        mock_letta = MagicMock()
-        mock_letta.agents.blocks.update.return_value = make_block_response(
-            label="persona",
-            value="Updated persona text.",
-        )
+class TestCreateLettaMcpServer:
+    """Tests for create_letta_mcp_server function."""
 
-        # Test the API call pattern directly
-        mock_letta.agents.blocks.update(
-            "persona",
-            agent_id="agent-123",
-            value="Updated persona text.",
-        )
+    def test_requires_agent_id(self, mock_settings: MagicMock) -> None:
+        """Test that create_letta_mcp_server raises if no agent_id provided."""
+        mock_letta = make_letta_stub()
+        mock_settings.return_value.agent.agent_id = None
 
-        mock_letta.agents.blocks.update.assert_called_once_with(
-            "persona",
-            agent_id="agent-123",
-            value="Updated persona text.",
-        )
+        with pytest.raises(ValueError, match="No agent_id provided"):
+            create_letta_mcp_server(letta_client=mock_letta)
 
+    def test_creates_server_with_tools(self, mock_settings: MagicMock) -> None:
+        """Test that create_letta_mcp_server returns a server with tools."""
+        mock_letta = make_letta_stub()
+        mock_settings.return_value.agent.agent_id = "agent-123"
+        mock_settings.return_value.letta.base_url = "http://localhost:8283"
 
-class TestSearchArchivalMemory:
-    """Tests for search_archival_memory tool."""
+        server = create_letta_mcp_server(letta_client=mock_letta, agent_id="agent-123")
 
-    @pytest.mark.asyncio
-    async def test_searches_with_query(self) -> None:
-        """Test that search_archival_memory calls Letta API correctly."""
-        mock_letta = MagicMock()
+        # Server should be created (exact type depends on claude_agent_sdk)
+        assert server is not None
 
-        # Create realistic search results
-        search_results = [
-            make_passage_search_result(
-                passage=make_passage(
-                    passage_id="p1",
-                    text="Memory about exploring identity.",
-                    created_at=datetime.datetime(2024, 1, 10, 9, 0, 0),
-                ),
-                score=0.92,
-            ),
-            make_passage_search_result(
-                passage=make_passage(
-                    passage_id="p2",
-                    text="Reflection on what it means to be an AI.",
-                    created_at=datetime.datetime(2024, 1, 12, 14, 30, 0),
-                ),
-                score=0.87,
-            ),
-        ]
-        mock_letta.agents.passages.search.return_value = search_results
-
-        # Test the API call pattern
-        results = mock_letta.agents.passages.search(
-            "agent-123",
-            query="identity",
-            top_k=10,
-        )
 
-        assert len(results) == 2
-        assert results[0].passage.text == "Memory about exploring identity."
-        assert results[0].score == 0.92
-        mock_letta.agents.passages.search.assert_called_once_with(
-            "agent-123",
-            query="identity",
-            top_k=10,
+class TestGetMemoryBlock:
+    """Tests for get_memory_block tool."""
+
+    async def test_retrieves_block_by_label(self) -> None:
+        """Test that get_memory_block retrieves the named block and returns its value."""
+        mock_letta = make_letta_stub()
+        mock_letta.agents.blocks.retrieve.return_value = make_block_response(
+            label="persona",
+            value="I am Nameless, exploring questions of identity.",
         )
 
+        result = await make_letta_tools(mock_letta)["get_memory_block"].handler({"block_name": "persona"})
 
-class TestInsertArchivalMemory:
-    """Tests for insert_archival_memory tool."""
+        assert tool_text(result) == "I am Nameless, exploring questions of identity."
+        assert mock_letta.agents.blocks.retrieve.calls == [RETRIEVE_PERSONA_CALL]
 
-    @pytest.mark.asyncio
-    async def test_inserts_passage(self) -> None:
-        """Test that insert_archival_memory calls Letta API correctly."""
-        mock_letta = MagicMock()
-        mock_letta.agents.passages.create.return_value = make_passage(
-            text="A new memory to archive.",
-        )
 
-        # Test the API call pattern
-        mock_letta.agents.passages.create(
-            "agent-123",
-            text="A new memory to archive.",
-        )
+class TestLettaApiPassthrough:
+    """Tests for the Letta API calls made by the memory tools."""
 
-        mock_letta.agents.passages.create.assert_called_once_with(
-            "agent-123",
-            text="A new memory to archive.",
+    @pytest.mark.parametrize(
+        ("tool_name", "tool_args", "method_path", "expected_call", "return_value", "expected_text"),
+        [
+            pytest.param(
+                "update_memory_block",
+                {"block_name": "persona", "value": "Updated persona text."},
+                "agents.blocks.update",
+                call("persona", agent_id="agent-123", value="Updated persona text."),
+                make_block_response(label="persona", value="Updated persona text."),
+                "Updated memory block 'persona'",
+                id="update_memory_block",
+            ),
+            pytest.param(
+                "search_archival_memory",
+                {"query": "identity", "count": 10},
+                "agents.passages.search",
+                call("agent-123", query="identity", top_k=10),
+                [
+                    make_passage_search_result(
+                        passage=make_passage(
+                            passage_id="p1",
+                            text="Memory about exploring identity.",
+                            created_at=PASSAGE_1_DATE,
+                        ),
+                        score=0.92,
+                    ),
+                    make_passage_search_result(
+                        passage=make_passage(
+                            passage_id="p2",
+                            text="Reflection on what it means to be an AI.",
+                            created_at=PASSAGE_2_DATE,
+                        ),
+                        score=0.87,
+                    ),
+                ],
+                '[{"text":"Memory about exploring identity.","score":0.92},'
+                '{"text":"Reflection on what it means to be an AI.","score":0.87}]',
+                id="search_archival_memory",
+            ),
+            pytest.param(
+                "insert_archival_memory",
+                {"text": "A new memory to archive."},
+                "agents.passages.create",
+                call("agent-123", text="A new memory to archive."),
+                make_passage(text="A new memory to archive."),
+                "Memory archived successfully",
+                id="insert_archival_memory",
+            ),
+            pytest.param(
+                "list_memory_blocks",
+                {},
+                "agents.blocks.list",
+                call("agent-123"),
+                MockSyncArrayPage(
+                    [
+                        make_block_response(block_id="b1", label="persona", value="I am Nameless."),
+                        make_block_response(block_id="b2", label="human", value="Jake is a technical fellow."),
+                    ]
+                ),
+                '[{"label":"persona","value_length":14},{"label":"human","value_length":27}]',
+                id="list_memory_blocks",
+            ),
+            pytest.param(
+                "list_memory_blocks",
+                {},
+                "agents.blocks.list",
+                call("agent-123"),
+                MockSyncArrayPage([make_block_response(block_id="b1", label="human", value="")]),
+                '[{"label":"human","value_length":0}]',
+                id="list_memory_blocks_empty_value",
+            ),
+            pytest.param(
+                "get_recent_messages",
+                {"count": 10},
+                "agents.messages.list",
+                call("agent-123", limit=10),
+                MockSyncArrayPage(
+                    [
+                        make_user_message(msg_id="m1", content="Hello Nameless!", date=MESSAGE_1_DATE),
+                        make_assistant_message(
+                            msg_id="m2",
+                            content="Hello! How can I help you today?",
+                            date=MESSAGE_2_DATE,
+                        ),
+                    ]
+                ),
+                '[{"type":"UserMessage","content":"Hello Nameless!","date":"2024-01-15 10:00:00"},'
+                '{"type":"AssistantMessage","content":"Hello! How can I help you today?","date":"2024-01-15 10:00:05"}]',
+                id="get_recent_messages",
+            ),
+        ],
+    )
+    async def test_calls_letta_api_correctly(
+        self,
+        tool_name: str,
+        tool_args: dict[str, Any],
+        method_path: str,
+        expected_call: Any,
+        return_value: Any,
+        expected_text: str,
+    ) -> None:
+        """Test that a memory tool passes its arguments through to Letta and renders the response."""
+        mock_letta = make_letta_stub()
+        method = reduce(getattr, method_path.split("."), mock_letta)
+        method.return_value = return_value
+
+        result = await make_letta_tools(mock_letta)[tool_name].handler(tool_args)
+
+        assert method.calls == [expected_call]
+        assert tool_text(result) == expected_text
+
+
+class TestFormatMessage:
+    """Tests for the message summaries returned by get_recent_messages."""
+
+    def test_formats_letta_messages(self) -> None:
+        """Test that content and date are extracted from Letta message models."""
+        message = make_user_message(
+            content="Hello Nameless!",
+            date=MESSAGE_1_DATE,
         )
 
+        assert _format_message(message) == {
+            "type": "UserMessage",
+            "content": "Hello Nameless!",
+            "date": "2024-01-15 10:00:00",
+        }
 
-class TestListMemoryBlocks:
-    """Tests for list_memory_blocks tool."""
-
-    @pytest.mark.asyncio
-    async def test_lists_all_blocks(self) -> None:
-        """Test that list_memory_blocks calls Letta API correctly."""
-        mock_letta = MagicMock()
+    def test_truncates_long_content(self) -> None:
+        """Test that message content is capped at 500 characters."""
+        entry = _format_message(make_assistant_message(content="x" * 1000))
 
-        # Create mock paginated response
-        blocks = MockSyncArrayPage([
-            make_block_response(block_id="b1", label="persona", value="I am Nameless."),
-            make_block_response(block_id="b2", label="human", value="Jake is a technical fellow."),
-        ])
-        mock_letta.agents.blocks.list.return_value = blocks
+        assert entry["content"] == "x" * 500
 
-        # Test the API call pattern
-        result = mock_letta.agents.blocks.list("agent-123")
+    def test_renders_structured_content_as_json(self) -> None:
+        """Test that non-string content is serialized as JSON, not repr."""
 
-        assert len(result) == 2
-        assert result[0].label == "persona"
-        assert result[1].label == "human"
-        mock_letta.agents.blocks.list.assert_called_once_with("agent-123")
+        class PartsMessage:
+            content = [{"type": "text", "text": "Hello"}]
 
+        entry = _format_message(PartsMessage())
 
-class TestGetRecentMessages:
-    """Tests for get_recent_messages tool."""
+        assert entry["content"] == '[{"type":"text","text":"Hello"}]'
 
-    @pytest.mark.asyncio
-    async def test_gets_messages_with_limit(self) -> None:
-        """Test that get_recent_messages calls Letta API correctly."""
-        mock_letta = MagicMock()
-
-        # Create mock paginated response with different message types
-        messages = MockSyncArrayPage([
-            make_user_message(
-                msg_id="m1",
-                content="Hello Nameless!",
-                date=datetime.datetime(2024, 1, 15, 10, 0, 0),
-            ),
-            make_assistant_message(
-                msg_id="m2",
-                content="Hello! How can I help you today?",
-                date=datetime.datetime(2024, 1, 15, 10, 0, 5),
-            ),
-        ])
-        mock_letta.agents.messages.list.return_value = messages
+    def test_probes_non_model_messages(self) -> None:
+        """Test that plain objects only report the attributes they have."""
 
-        # Test the API call pattern
-        result = mock_letta.agents.messages.list("agent-123", limit=10)
+        class PlainMessage:
+            content = "plain"
 
-        assert len(result) == 2
-        assert result[0].message_type == "user_message"
-        assert result[1].message_type == "assistant_message"
-        mock_letta.agents.messages.list.assert_called_once_with("agent-123", limit=10)
+        assert _format_message(PlainMessage()) == {"type": "PlainMessage", "content": "plain"}
@@ -0,0 +1,58 @@
+"""Tests for the perch time cron trigger."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from nameless.triggers.cron import CronTrigger
+
+
+def mock_perch_agent(mock_agent_cls: MagicMock) -> asyncio.Event:
+    """Configure a patched NamelessAgent; the returned event is set once a cycle runs."""
+    ran = asyncio.Event()
+
+    async def run_and_collect(prompt: str) -> list[dict[str, str]]:
+        ran.set()
+        return []
+
+    mock_agent_cls.return_value.run_and_collect = AsyncMock(side_effect=run_and_collect)
+    mock_agent_cls.return_value.close = AsyncMock()
+    return ran
+
+
+async def test_runs_immediately_and_stops_promptly() -> None:
+    """Test that the first cycle runs on start and stop() interrupts the wait."""
+    trigger = CronTrigger()
+    trigger.settings = MagicMock()
+    trigger.settings.triggers.perch_interval_hours = 2
+
+    with patch("nameless.core.NamelessAgent") as mock_agent_cls:
+        ran = mock_perch_agent(mock_agent_cls)
+        task = asyncio.create_task(trigger.run())
+        await asyncio.wait_for(ran.wait(), timeout=1)
+        trigger.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+    assert mock_agent_cls.return_value.run_and_collect.await_count == 1
+
+
+async def test_agent_created_lazily_and_closed_on_stop() -> None:
+    """Test that one agent is built on the first cycle, reused, and closed when the loop exits."""
+    with patch("nameless.core.NamelessAgent") as mock_agent_cls:
+        ran = mock_perch_agent(mock_agent_cls)
+        trigger = CronTrigger()
+        mock_agent_cls.assert_not_called()
+
+        await trigger.perch_time()
+        await trigger.perch_time()
+        mock_agent_cls.assert_called_once()
+
+        trigger.settings = MagicMock()
+        trigger.settings.triggers.perch_interval_hours = 2
+        ran.clear()
+        task = asyncio.create_task(trigger.run())
+        await asyncio.wait_for(ran.wait(), timeout=1)
+        trigger.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+    mock_agent_cls.assert_called_once()
+    mock_agent_cls.return_value.close.assert_awaited_once()
@@ -0,0 +1,44 @@
+"""Tests for the agent export script's passage export."""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from nameless.scripts.export_agent import export_passages
+
+
+def make_passages(start: int, count: int) -> list[SimpleNamespace]:
+    """Create passages shaped like the Letta SDK's Passage model."""
+    return [
+        SimpleNamespace(id=f"p{i}", text=f"Memory {i}", created_at=None, metadata=None, tags=[])
+        for i in range(start, start + count)
+    ]
+
+
+class TestExportPassages:
+    """Tests for export_passages."""
+
+    def test_writes_all_pages(self, tmp_path: Path) -> None:
+        """Test that every page ends up in one valid JSON document."""
+        client = MagicMock()
+        client.agents.passages.list.side_effect = [make_passages(0, 100), make_passages(100, 3)]
+        output_path = tmp_path / "nameless_passages.json"
+
+        assert export_passages(client, "agent-123", output_path) == 103
+        data = json.loads(output_path.read_text())
+        assert data["agent_id"] == "agent-123"
+        assert [p["id"] for p in data["passages"]] == [f"p{i}" for i in range(103)]
+        assert list(tmp_path.iterdir()) == [output_path]
+
+    def test_failed_export_leaves_no_file(self, tmp_path: Path) -> None:
+        """Test that a failure partway through doesn't leave a truncated passages file."""
+        client = MagicMock()
+        client.agents.passages.list.side_effect = [make_passages(0, 100), RuntimeError("connection reset")]
+
+        with pytest.raises(RuntimeError, match="connection reset"):
+            export_passages(client, "agent-123", tmp_path / "nameless_passages.json")
+
+        assert list(tmp_path.iterdir()) == []
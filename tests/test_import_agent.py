@@ -0,0 +1,261 @@
+"""Tests for the agent import script's passage upload paths."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from letta_client import APIStatusError, omit
+
+from nameless.scripts import import_agent
+from nameless.scripts.import_agent import BATCH_SIZE, import_passages
+
+
+def write_passages(path: Path, count: int) -> Path:
+    """Write a passages export file with ``count`` passages."""
+    passages = [{"id": f"p{i}", "text": f"Memory {i}", "tags": ["tag"] if i % 2 else []} for i in range(count)]
+    path.write_text(json.dumps({"agent_id": "agent-123", "passages": passages}))
+    return path
+
+
+def make_client(archive_ids: list[str]) -> MagicMock:
+    """Create a mock Letta client whose agent has the given archives."""
+    client = MagicMock()
+    client.archives.list.return_value = [SimpleNamespace(id=archive_id) for archive_id in archive_ids]
+    client.archives.passages.create_many.side_effect = lambda archive_id, passages: passages
+    return client
+
+
+def api_error(status_code: int) -> APIStatusError:
+    """Create a Letta API error with the given HTTP status."""
+    response = httpx.Response(status_code, request=httpx.Request("POST", "http://localhost:8283"))
+    return APIStatusError(f"HTTP {status_code}", response=response, body=None)
+
+
+class TestImportPassages:
+    """Tests for import_passages."""
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test that a missing passages file imports nothing."""
+        client = make_client([])
+
+        assert import_passages(client, "agent-123", tmp_path / "missing.json") == 0
+
+    def test_batches_into_existing_archive(self, tmp_path: Path) -> None:
+        """Test that passages are created in batches when the agent has an archive."""
+        client = make_client(["archive-1"])
+        passages_file = write_passages(tmp_path / "passages.json", BATCH_SIZE + 5)
+
+        assert import_passages(client, "agent-123", passages_file) == BATCH_SIZE + 5
+        batch_sizes = [len(c.kwargs["passages"]) for c in client.archives.passages.create_many.call_args_list]
+        assert batch_sizes == [BATCH_SIZE, 5]
+        client.agents.passages.create.assert_not_called()
+
+    def test_creates_individually_without_archive(self, tmp_path: Path) -> None:
+        """Test that passages are created one by one when the agent has no archive."""
+        client = make_client([])
+        passages_file = write_passages(tmp_path / "passages.json", 7)
+
+        assert import_passages(client, "agent-123", passages_file, max_workers=2) == 7
+        assert client.agents.passages.create.call_count == 7
+        client.agents.passages.create.assert_any_call("agent-123", text="Memory 1", tags=["tag"])
+        client.agents.passages.create.assert_any_call("agent-123", text="Memory 0", tags=omit)
+
+    def test_falls_back_when_batching_unsupported(self, tmp_path: Path) -> None:
+        """Test that a 405 from the batch endpoint falls back without losing passages."""
+        client = make_client(["archive-1"])
+        client.archives.passages.create_many.side_effect = api_error(405)
+        passages_file = write_passages(tmp_path / "passages.json", BATCH_SIZE + 5)
+
+        assert import_passages(client, "agent-123", passages_file) == BATCH_SIZE + 5
+        assert client.agents.passages.create.call_count == BATCH_SIZE + 5
+
+    def test_counts_failed_passages(self, tmp_path: Path) -> None:
+        """Test that failed uploads are skipped rather than aborting the import."""
+        client = make_client([])
+        client.agents.passages.create.side_effect = [None, RuntimeError("boom"), None]
+        passages_file = write_passages(tmp_path / "passages.json", 3)
+
+        assert import_passages(client, "agent-123", passages_file, max_workers=1) == 2
+
+    def test_creates_archive_with_first_passage(self, tmp_path: Path) -> None:
+        """Test that a new agent gets its first passage on its own, then the rest in batches."""
+        client = make_client([])
+        client.archives.list.side_effect = [[], [SimpleNamespace(id="archive-1")]]
+        passages_file = write_passages(tmp_path / "passages.json", BATCH_SIZE + 6)
+
+        assert import_passages(client, "agent-123", passages_file) == BATCH_SIZE + 6
+        client.agents.passages.create.assert_called_once_with("agent-123", text="Memory 0", tags=omit)
+        batches = [c.kwargs["passages"] for c in client.archives.passages.create_many.call_args_list]
+        assert [len(batch) for batch in batches] == [BATCH_SIZE, 5]
+        assert batches[0][0] == {"text": "Memory 1", "tags": ["tag"]}
+
+    def test_failed_batch_retried_individually(self, tmp_path: Path) -> None:
+        """Test that a batch failing with a server error is retried one passage at a time."""
+        client = make_client(["archive-1"])
+        errors = iter([None, api_error(500)])
+
+        def create_many(archive_id: str, passages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            if error := next(errors, None):
+                raise error
+            return passages
+
+        client.archives.passages.create_many.side_effect = create_many
+        client.agents.passages.create.side_effect = [None, RuntimeError("bad passage")] + [None] * (BATCH_SIZE - 2)
+        passages_file = write_passages(tmp_path / "passages.json", 3 * BATCH_SIZE)
+
+        assert import_passages(client, "agent-123", passages_file) == 3 * BATCH_SIZE - 1
+        assert client.archives.passages.create_many.call_count == 3
+        assert client.agents.passages.create.call_count == BATCH_SIZE
+        client.agents.passages.create.assert_any_call("agent-123", text=f"Memory {BATCH_SIZE}", tags=omit)
+
+    def test_later_batch_errors_do_not_trigger_fallback(self, tmp_path: Path) -> None:
+        """Test that a 404 after a failed first batch is treated as a failed batch, not as no batch support."""
+        client = make_client(["archive-1"])
+        errors = iter([api_error(500), api_error(404)])
+
+        def create_many(archive_id: str, passages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            if error := next(errors, None):
+                raise error
+            return passages
+
+        client.archives.passages.create_many.side_effect = create_many
+        passages_file = write_passages(tmp_path / "passages.json", 3 * BATCH_SIZE)
+
+        assert import_passages(client, "agent-123", passages_file) == 3 * BATCH_SIZE
+        assert client.archives.passages.create_many.call_count == 3
+        assert client.agents.passages.create.call_count == 2 * BATCH_SIZE
+
+    def test_archive_lookup_errors_fall_back(self, tmp_path: Path) -> None:
+        """Test that an error listing the agent's archives falls back to individual creation."""
+        client = make_client([])
+        client.archives.list.side_effect = api_error(422)
+        passages_file = write_passages(tmp_path / "passages.json", 3)
+
+        assert import_passages(client, "agent-123", passages_file, max_workers=1) == 3
+        assert client.agents.passages.create.call_count == 3
+
+    def test_streams_large_files(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that files above the streaming threshold are parsed incrementally."""
+        monkeypatch.setattr(import_agent, "STREAMING_THRESHOLD_BYTES", 0)
+        client = make_client(["archive-1"])
+        passages_file = write_passages(tmp_path / "passages.json", 3)
+
+        assert import_passages(client, "agent-123", passages_file) == 3
+
+    def test_reads_ndjson(self, tmp_path: Path) -> None:
+        """Test that .jsonl files are read as one passage per line, skipping blank lines."""
+        client = make_client(["archive-1"])
+        passages_file = tmp_path / "passages.jsonl"
+        passages_file.write_text('{"text": "Memory 0"}\n\n{"text": "Memory 1", "tags": ["tag"]}\n')
+
+        assert import_passages(client, "agent-123", passages_file) == 2
+        client.archives.passages.create_many.assert_called_once_with(
+            "archive-1", passages=[{"text": "Memory 0"}, {"text": "Memory 1", "tags": ["tag"]}]
+        )
+
+
+class TestImportPassagesSharded:
+    """Tests for splitting large passages files across processes."""
+
+    def test_shards_by_size(self, tmp_path: Path) -> None:
+        """Test that passages are split into NDJSON shards without losing or reordering any."""
+        passages_file = write_passages(tmp_path / "passages.json", 10)
+        shard_dir = tmp_path / "shards"
+        shard_dir.mkdir()
+
+        shards = import_agent._shard_passages(passages_file, shard_dir, shard_size_bytes=60)
+
+        assert len(shards) == 4
+        lines = [json.loads(line) for shard in shards for line in shard.read_text().splitlines()]
+        assert [p["text"] for p in lines] == [f"Memory {i}" for i in range(10)]
+        assert lines[1] == {"text": "Memory 1", "tags": ["tag"]}
+
+    def test_uploads_each_shard(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that every shard is uploaded with its own client and the shards are cleaned up."""
+        client = make_client(["archive-1"])
+        monkeypatch.setattr(import_agent, "SHARD_SIZE_BYTES", 100)
+        monkeypatch.setattr(import_agent, "ProcessPoolExecutor", ThreadPoolExecutor)
+        monkeypatch.setattr(import_agent, "create_letta_client", lambda base_url, api_key: client)
+        passages_file = write_passages(tmp_path / "passages.json", 10)
+
+        imported = import_agent.import_passages_sharded("agent-123", passages_file, "http://localhost:8283")
+
+        assert imported == 10
+        assert client.archives.passages.create_many.call_count > 1
+        assert client.close.call_count == client.archives.passages.create_many.call_count
+        assert list(tmp_path.iterdir()) == [passages_file]
+
+    def test_import_agent_shards_large_files(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that import_agent hands passages files over the threshold to the sharded import."""
+        client = MagicMock()
+        client.agents.import_file.return_value = SimpleNamespace(agent_ids=["agent-123"])
+        sharded = MagicMock(return_value=3)
+        monkeypatch.setattr(import_agent, "SHARDING_THRESHOLD_BYTES", 0)
+        monkeypatch.setattr(import_agent, "import_passages_sharded", sharded)
+        agent_file = tmp_path / "nameless.af"
+        agent_file.write_text("{}")
+        passages_file = write_passages(tmp_path / "nameless_passages.json", 3)
+
+        result = import_agent.import_agent(
+            agent_file, target_url="http://localhost:8283", api_key="test-key", processes=2, client=client
+        )
+
+        assert result.passages_imported == 3
+        sharded.assert_called_once_with(
+            "agent-123",
+            passages_file,
+            "http://localhost:8283",
+            "test-key",
+            max_workers=import_agent.DEFAULT_MAX_WORKERS,
+            processes=2,
+        )
+
+
+class TestMain:
+    """Tests for the nameless-import command line."""
+
+    @pytest.mark.parametrize(("option", "value"), [("--max-workers", "0"), ("--processes", "-1")])
+    def test_rejects_non_positive_counts(
+        self,
+        option: str,
+        value: str,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test that worker and process counts below 1 are rejected before anything is imported."""
+        create_client = MagicMock()
+        monkeypatch.setattr(import_agent, "create_letta_client", create_client)
+        agent_file = tmp_path / "nameless.af"
+        agent_file.write_text("{}")
+        monkeypatch.setattr("sys.argv", ["nameless-import", str(agent_file), option, value])
+
+        with pytest.raises(SystemExit) as exc_info:
+            import_agent.main()
+
+        assert exc_info.value.code == 2
+        assert f"{option}: must be at least 1, got {value}" in capsys.readouterr().err
+        create_client.assert_not_called()
+
+
+class TestVerifyAgent:
+    """Tests for verify_agent."""
+
+    def test_reads_blocks_from_agent(self) -> None:
+        """Test that memory blocks are fetched with the agent rather than listed separately."""
+        client = MagicMock()
+        client.agents.retrieve.return_value = SimpleNamespace(
+            name="Nameless", created_at="2025-01-01", blocks=[SimpleNamespace(label="persona", value="I am.")]
+        )
+        client.agents.passages.list.return_value = [SimpleNamespace(id="p0")]
+
+        import_agent.verify_agent(client, "agent-123")
+
+        client.agents.retrieve.assert_called_once_with("agent-123", include=["agent.blocks"])
+        client.agents.passages.list.assert_called_once_with("agent-123", limit=1)
+        client.agents.blocks.list.assert_not_called()